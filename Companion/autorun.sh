@@ -22,8 +22,13 @@ fi
 cd "$SCRIPT_DIR"
 
 # Run the launch script
+# -I (isolated mode) and -S (no site.py) skip user site-packages and path scanning,
+# which dominate startup for a script this small. Importing launch_app (rather than
+# running it as a script) lets Python use the bytecode precompiled by setup.sh; the
+# import system checks it against this interpreter and falls back to the source if
+# it is stale, e.g. after a Python upgrade.
 echo "Attempting to launch the host application..."
-python3 launch_app.py
+python3 -I -S -c 'import sys; sys.path.insert(0, sys.argv[1]); import launch_app; launch_app.launch_application()' "$SCRIPT_DIR"
 
 LAUNCH_EXIT_CODE=$?
 
@@ -1,18 +1,15 @@
-import platform
 import sys
 
+# The host OS cannot change mid-process, so resolve it once at import time.
+# sys.platform avoids importing the platform module just to read the OS name.
+_OS = {"darwin": "mac", "win32": "windows", "linux": "linux"}.get(sys.platform)
+
 def get_os():
     """Detects the host operating system."""
-    system = platform.system().lower()
-    if system == "darwin":
-        return "mac"
-    elif system == "windows":
-        return "windows"
-    elif system == "linux":
-        return "linux"
-    else:
-        print(f"Unsupported OS: {system}", file=sys.stderr)
+    if _OS is None:
+        print(f"Unsupported OS: {sys.platform}", file=sys.stderr)
         sys.exit(1)
+    return _OS
 
 if __name__ == "__main__":
     print(get_os())
\ No newline at end of file
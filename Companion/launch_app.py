@@ -1,80 +1,183 @@
-import subprocess
 import sys
 import os
-from detect_os import get_os
+
+from detect_os import get_os # autorun.sh puts this directory on sys.path
+
+# Resolved once at import; the install location does not move while running.
+# This assumes the App build exists at a known path relative to the Companion scripts.
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+_APP_BASE_DIR = os.path.abspath(os.path.join(_SCRIPT_DIR, '..', 'App')) # Go up one level, then into App
+
+# Optional manifest emitted by the build with one "<os>=<app path>" line per OS
+_MANIFEST_FILE = os.path.join(_SCRIPT_DIR, '.app_manifest')
+
+# Sidecar cache remembering where the App executable was found last time
+_CACHE_FILE = os.path.join(os.path.expanduser('~'), '.cache', 'ait_companion', 'app_path.json')
+
+# Matches any launchable artifact name, capturing its extension.
+# Compiled by _find_first on first use: importing re costs more than a manifest or cache hit.
+_SUFFIX_RE = None
+
+def _find_first(directory, suffix):
+    """Returns the path of the first artifact in directory with the given suffix, or None."""
+    global _SUFFIX_RE
+    if _SUFFIX_RE is None:
+        import re
+        _SUFFIX_RE = re.compile(r'.+(\.(?:app|exe|AppImage))\Z')
+    match = _SUFFIX_RE.match
+    with os.scandir(directory) as it:
+        for entry in it:
+            m = match(entry.name)
+            if m and m.group(1) == suffix:
+                return entry.path
+    return None
+
+def _mac_bundle_executable(bundle_path):
+    """Returns the executable inside a .app bundle as named by its Info.plist, or None."""
+    import plistlib
+    try:
+        with open(os.path.join(bundle_path, 'Contents', 'Info.plist'), 'rb') as f:
+            name = plistlib.load(f)['CFBundleExecutable']
+        binary = os.path.join(bundle_path, 'Contents', 'MacOS', name)
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    return binary if os.access(binary, os.X_OK) else None
+
+def _spawn_mac_app(app_path):
+    """Starts a Mac app without waiting, directly if its bundle binary was resolved."""
+    if not app_path.endswith('.app'):
+        os.posix_spawn(app_path, [app_path], os.environ)
+    else:
+        # No usable binary in the bundle; let LaunchServices open it instead
+        import subprocess
+        subprocess.Popen(["open", app_path])
+    # Only the Mac path returns here; a successful exec never gets to print
+    print("Successfully launched application for mac.")
+
+def _exec_app(app_path):
+    """Replaces this process with the App rather than forking and waiting on it."""
+    # Buffered output would be lost across the exec, so flush it first
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os.execv(app_path, [app_path])
+
+# Per OS: build output location (relative to the App directory), artifact suffix,
+# artifact description, whether it needs the executable bit set, and how to start it
+_LAUNCH_TABLE = {
+    'mac': (('src-tauri', 'target', 'release', 'bundle', 'macos'), '.app', 'Mac .app bundle', False, _spawn_mac_app),
+    'windows': (('src-tauri', 'target', 'release'), '.exe', 'Windows .exe', False, _exec_app),
+    'linux': (('src-tauri', 'target', 'release', 'bundle', 'appimage'), '.AppImage', 'Linux AppImage', True, _exec_app),
+}
+
+def _read_manifest_path(detected_os):
+    """Returns the app path listed for this OS in the build manifest if it exists, or None."""
+    try:
+        with open(_MANIFEST_FILE) as f:
+            lines = f.read().splitlines()
+    except OSError:
+        return None
+    prefix = detected_os + '='
+    for line in lines:
+        if line.startswith(prefix):
+            app_path = line[len(prefix):].strip()
+            # A stale manifest falls back to the cache and directory scan
+            return app_path if app_path and os.path.exists(app_path) else None
+    return None
+
+def _load_cached_path(detected_os, app_base_dir):
+    """Returns the cached app path if it is still valid for this OS and App directory, or None."""
+    import json # Deferred: manifest hits never touch the cache
+    try:
+        with open(_CACHE_FILE) as f:
+            cached = json.load(f)
+        if cached.get('os') != detected_os or cached.get('app_base_dir') != app_base_dir:
+            return None
+        app_path = cached['app_path']
+        # A rebuild replaces the artifact and touches its directory, invalidating the entry
+        if os.stat(os.path.dirname(app_path)).st_mtime != cached['mtime'] or not os.path.exists(app_path):
+            return None
+        return app_path
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return None
+
+def _save_cached_path(detected_os, app_base_dir, app_path):
+    """Records the resolved app path so later launches can skip the directory scan."""
+    import json
+    try:
+        entry = {
+            'os': detected_os,
+            'app_base_dir': app_base_dir,
+            'app_path': app_path,
+            'mtime': os.stat(os.path.dirname(app_path)).st_mtime,
+        }
+        os.makedirs(os.path.dirname(_CACHE_FILE), exist_ok=True)
+        with open(_CACHE_FILE, 'w') as f:
+            json.dump(entry, f)
+    except OSError:
+        pass # The cache is an optimisation only; never fail a launch over it
+
+def _resolve_app_path(detected_os, app_base_dir):
+    """Finds the App executable for detected_os, ready to launch; raises FileNotFoundError if missing."""
+    subpath, suffix, artifact_name, needs_chmod, _ = _LAUNCH_TABLE[detected_os]
+    # Prefer the path recorded by the build, then the sidecar cache, before scanning
+    manifest_path = _read_manifest_path(detected_os)
+    cached_path = None
+    if manifest_path is None or manifest_path.endswith('.app'):
+        cached_path = _load_cached_path(detected_os, app_base_dir)
+        # A manifest .app still needs its binary resolved; reuse a cached one from that bundle
+        if manifest_path and cached_path and not cached_path.startswith(manifest_path + os.sep):
+            cached_path = None
+
+    app_path = cached_path or manifest_path
+    if not app_path:
+        bundle_dir = os.path.join(app_base_dir, *subpath)
+        # Check up front rather than letting scandir raise on the common "not built yet" path
+        if not os.path.isdir(bundle_dir):
+            raise FileNotFoundError(f"{artifact_name} not built at {bundle_dir}.")
+        app_path = _find_first(bundle_dir, suffix)
+    if not app_path:
+        raise FileNotFoundError(f"{artifact_name} not found in expected location.")
+    if app_path.endswith('.app'):
+        # Launch the bundle's binary directly; the resolved binary is what gets cached
+        app_path = _mac_bundle_executable(app_path) or app_path
+    # Only record newly resolved paths; manifest entries and cache hits are already known
+    if app_path != cached_path and app_path != manifest_path:
+        _save_cached_path(detected_os, app_base_dir, app_path)
+
+    if needs_chmod:
+        # Make executable if needed; usually it already is, so skip the metadata write
+        st = os.stat(app_path)
+        if st.st_mode & 0o111 != 0o111:
+            os.chmod(app_path, (st.st_mode & 0o7777) | 0o755)
+    return app_path
 
 def launch_application():
     """Launches the desktop application based on the detected OS."""
     detected_os = get_os()
-    app_path = "" # Placeholder - needs to be determined based on build location
-
-    # Determine the path to the App executable relative to this script
-    # This assumes the Companion scripts are run from the Companion directory
-    # and the App build exists at a known relative path.
-    # Adjust this logic based on the actual build output structure.
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    app_base_dir = os.path.abspath(os.path.join(script_dir, '..', 'App')) # Go up one level, then into App
+    app_base_dir = _APP_BASE_DIR
 
     print(f"Detected OS: {detected_os}")
-    print(f"Script directory: {script_dir}")
+    print(f"Script directory: {_SCRIPT_DIR}")
     print(f"Calculated App base directory: {app_base_dir}")
 
+    # get_os() has already exited for any OS missing from the table
+    _, _, artifact_name, _, launch = _LAUNCH_TABLE[detected_os]
 
     try:
-        if detected_os == "mac":
-            # Example: Find .app bundle in src-tauri/target/release/bundle/macos/
-            # This path needs verification after the App is built
-            app_bundle_dir = os.path.join(app_base_dir, 'src-tauri', 'target', 'release', 'bundle', 'macos')
-            # Find the .app file (adjust name if needed)
-            app_name = next((f for f in os.listdir(app_bundle_dir) if f.endswith('.app')), None)
-            if not app_name:
-                raise FileNotFoundError("Mac .app bundle not found in expected location.")
-            app_path = os.path.join(app_bundle_dir, app_name)
-            print(f"Attempting to launch Mac app: {app_path}")
-            subprocess.run(["open", app_path], check=True)
-
-        elif detected_os == "windows":
-            # Example: Find .exe in src-tauri/target/release/
-            # This path needs verification
-            app_exe_dir = os.path.join(app_base_dir, 'src-tauri', 'target', 'release')
-            # Find the .exe file (adjust name if needed)
-            app_name = next((f for f in os.listdir(app_exe_dir) if f.endswith('.exe')), None)
-            if not app_name:
-                 raise FileNotFoundError("Windows .exe not found in expected location.")
-            app_path = os.path.join(app_exe_dir, app_name)
-            print(f"Attempting to launch Windows app: {app_path}")
-            subprocess.run([app_path], check=True)
-
-        elif detected_os == "linux":
-            # Example: Find AppImage or deb package execution command
-            # This path needs verification - might be in src-tauri/target/release/bundle/appimage/ or similar
-            app_bundle_dir = os.path.join(app_base_dir, 'src-tauri', 'target', 'release', 'bundle', 'appimage')
-            app_name = next((f for f in os.listdir(app_bundle_dir) if f.endswith('.AppImage')), None)
-            if not app_name:
-                 raise FileNotFoundError("Linux AppImage not found in expected location.")
-            app_path = os.path.join(app_bundle_dir, app_name)
-            # Make executable if needed
-            os.chmod(app_path, 0o755)
-            print(f"Attempting to launch Linux app: {app_path}")
-            subprocess.run([app_path], check=True)
-
-        else:
-            print(f"Launch logic not implemented for OS: {detected_os}", file=sys.stderr)
-            sys.exit(1)
-
-        print(f"Successfully launched application for {detected_os}.")
+        app_path = _resolve_app_path(detected_os, app_base_dir)
+        print(f"Attempting to launch {artifact_name}: {app_path}")
+        launch(app_path) # Windows/Linux exec the App, so success prints nothing further
 
     except FileNotFoundError as e:
         print(f"Error: Application executable not found. {e}", file=sys.stderr)
         print("Please ensure the App has been built correctly and the path in launch_app.py is accurate.", file=sys.stderr)
         sys.exit(1)
-    except subprocess.CalledProcessError as e:
+    except OSError as e:
         print(f"Error launching application: {e}", file=sys.stderr)
         sys.exit(1)
     except Exception as e:
         print(f"An unexpected error occurred: {e}", file=sys.stderr)
         sys.exit(1)
 
-
 if __name__ == "__main__":
     launch_application()
\ No newline at end of file
@@ -94,6 +94,16 @@ SCRIPT_SOURCE_DIR="$( cd "$( dirname "${BASH_SOURCE[0]}" )" &> /dev/null && pwd
 cp "${SCRIPT_SOURCE_DIR}/detect_os.py" "${COMPANION_DIR}/detect_os.py" || print_error "Failed to copy detect_os.py."
 cp "${SCRIPT_SOURCE_DIR}/launch_app.py" "${COMPANION_DIR}/launch_app.py" || print_error "Failed to copy launch_app.py."
 cp "${SCRIPT_SOURCE_DIR}/autorun.sh" "${COMPANION_DIR}/autorun.sh" || print_error "Failed to copy autorun.sh."
+# Optional build manifest listing the App executable per OS
+if [ -f "${SCRIPT_SOURCE_DIR}/.app_manifest" ]; then
+    cp "${SCRIPT_SOURCE_DIR}/.app_manifest" "${COMPANION_DIR}/.app_manifest" || print_error "Failed to copy .app_manifest."
+fi
+
+print_status "Precompiling launcher bytecode..."
+# Writes __pycache__ bytecode that autorun.sh picks up when importing launch_app and detect_os.
+# Remove the legacy launch_app.pyc from older installs, which autorun.sh no longer uses.
+rm -f "${COMPANION_DIR}/launch_app.pyc"
+python3 -m compileall -q "${COMPANION_DIR}/launch_app.py" "${COMPANION_DIR}/detect_os.py" || print_error "Failed to precompile the launcher modules."
 
 # 5. Set Permissions
 print_status "Setting script permissions..."
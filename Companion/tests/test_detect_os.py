@@ -1,41 +1,54 @@
 import unittest
 from unittest.mock import patch
+import importlib
 import sys
 import io
 
 # Adjust the path to import from the parent directory
 sys.path.insert(0, '..')
-from detect_os import get_os
+import detect_os
 
 class TestDetectOS(unittest.TestCase):
 
-    @patch('platform.system')
-    def test_get_os_mac(self, mock_system):
+    def _reload_get_os(self):
+        # The OS is captured at import time, so reload under the active patch
+        return importlib.reload(detect_os).get_os
+
+    def tearDown(self):
+        # Restore the real host OS for any other tests
+        importlib.reload(detect_os)
+
+    @patch('sys.platform', 'darwin')
+    def test_get_os_mac(self):
         """Test OS detection for macOS."""
-        mock_system.return_value = 'Darwin'
-        self.assertEqual(get_os(), 'mac')
+        self.assertEqual(self._reload_get_os()(), 'mac')
 
-    @patch('platform.system')
-    def test_get_os_windows(self, mock_system):
+    @patch('sys.platform', 'win32')
+    def test_get_os_windows(self):
         """Test OS detection for Windows."""
-        mock_system.return_value = 'Windows'
-        self.assertEqual(get_os(), 'windows')
+        self.assertEqual(self._reload_get_os()(), 'windows')
 
-    @patch('platform.system')
-    def test_get_os_linux(self, mock_system):
+    @patch('sys.platform', 'linux')
+    def test_get_os_linux(self):
         """Test OS detection for Linux."""
-        mock_system.return_value = 'Linux'
-        self.assertEqual(get_os(), 'linux')
+        self.assertEqual(self._reload_get_os()(), 'linux')
+
+    def test_get_os_cached(self):
+        """Test that the OS is resolved once, at import time."""
+        with patch('sys.platform', 'linux'):
+            get_os = self._reload_get_os()
+        with patch('sys.platform', 'darwin'):
+            self.assertEqual(get_os(), 'linux')
 
-    @patch('platform.system')
+    @patch('sys.platform', 'sunos5') # Example unsupported OS
     @patch('sys.stderr', new_callable=io.StringIO) # Capture stderr
-    def test_get_os_unsupported(self, mock_stderr, mock_system):
+    def test_get_os_unsupported(self, mock_stderr):
         """Test OS detection for an unsupported OS."""
-        mock_system.return_value = 'SunOS' # Example unsupported OS
+        get_os = self._reload_get_os()
         with self.assertRaises(SystemExit) as cm:
             get_os()
         self.assertEqual(cm.exception.code, 1)
-        self.assertIn("Unsupported OS: sunos", mock_stderr.getvalue())
+        self.assertIn("Unsupported OS: sunos5", mock_stderr.getvalue())
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
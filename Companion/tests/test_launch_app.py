@@ -2,165 +2,369 @@ import unittest
 from unittest.mock import patch, MagicMock, mock_open, call
 import sys
 import os
-import subprocess
 import io
+import tempfile
+import plistlib
+from types import SimpleNamespace
 
 # Adjust the path to import from the parent directory
 sys.path.insert(0, '..')
 # We need to import the module we are testing
 import launch_app
 
+# Captured before any test patches os.path.join, so side effects can defer to it
+_real_join = os.path.join
+
+def make_scandir(names, sep='/'):
+    """Builds an os.scandir side effect yielding entries for the given names."""
+    def scandir_side_effect(directory):
+        entries = [SimpleNamespace(name=n, path=directory + sep + n) for n in names]
+        cm = MagicMock()
+        cm.__enter__.return_value = iter(entries)
+        return cm
+    return scandir_side_effect
+
 class TestLaunchApp(unittest.TestCase):
 
+    # Expected os.path.join results per OS; anything else falls back to the real join
+    _JOIN_MAP_MAC = {
+        ('/path/to/App', 'src-tauri', 'target', 'release', 'bundle', 'macos'): '/path/to/App/src-tauri/target/release/bundle/macos',
+    }
+    _JOIN_MAP_WIN = {
+        ('C:\\path\\to\\App', 'src-tauri', 'target', 'release'): 'C:\\path\\to\\App\\src-tauri\\target\\release',
+    }
+    _JOIN_MAP_LINUX = {
+        ('/path/to/App', 'src-tauri', 'target', 'release', 'bundle', 'appimage'): '/path/to/App/src-tauri/target/release/bundle/appimage',
+    }
+
     # --- Mocks Setup ---
     # We need to mock dependencies used by launch_app.py:
-    # - detect_os.get_os
-    # - os.path.abspath, os.path.join, os.path.dirname
-    # - os.listdir
-    # - os.chmod (for Linux)
-    # - subprocess.run
-
-    @patch('launch_app.get_os')
-    @patch('subprocess.run')
-    @patch('os.path.abspath')
-    @patch('os.path.join')
-    @patch('os.listdir')
-    @patch('os.path.dirname')
-    def test_launch_mac(self, mock_dirname, mock_listdir, mock_join, mock_abspath, mock_run, mock_get_os):
-        """Test launching the app on macOS."""
-        mock_get_os.return_value = 'mac'
-        mock_dirname.return_value = '/path/to/Companion'
-        mock_abspath.return_value = '/path/to/App' # Mocked App base dir
-
-        # Configure os.path.join to return expected paths based on input
-        def join_side_effect(*args):
-            if args == ('/path/to/Companion', '..', 'App'):
-                return '/path/to/App'
-            elif args == ('/path/to/App', 'src-tauri', 'target', 'release', 'bundle', 'macos'):
-                return '/path/to/App/src-tauri/target/release/bundle/macos'
-            elif args == ('/path/to/App/src-tauri/target/release/bundle/macos', 'TestApp.app'):
-                 return '/path/to/App/src-tauri/target/release/bundle/macos/TestApp.app'
-            return os.path.normpath(os.path.join(*args)) # Default join behavior
-        mock_join.side_effect = join_side_effect
-
-        mock_listdir.return_value = ['SomeOtherFile', 'TestApp.app'] # Simulate finding the app
+    # - get_os
+    # - the import-time _SCRIPT_DIR/_APP_BASE_DIR constants, os.path.join
+    # - os.path.isdir, os.scandir
+    # - os.stat, os.chmod (for Linux)
+    # - the build manifest, the app path sidecar cache and the Mac bundle lookup
+    # - os.execv (Windows/Linux), os.posix_spawn / subprocess.Popen (Mac)
+    # - sys.stdout and sys.stderr, to capture status and error messages
+    # Patchers are started once per test here rather than stacked on every test.
+
+    def setUp(self):
+        self.mock_get_os = self._start('launch_app.get_os')
+        self.mock_join = self._start('os.path.join')
+        self.mock_isdir = self._start('os.path.isdir', return_value=True)
+        self.mock_scandir = self._start('os.scandir')
+        self.mock_stat = self._start('os.stat', return_value=SimpleNamespace(st_mode=0o100755))
+        self.mock_chmod = self._start('os.chmod')
+        self.mock_manifest = self._start('launch_app._read_manifest_path', return_value=None)
+        self.mock_load_cache = self._start('launch_app._load_cached_path', return_value=None)
+        self.mock_save_cache = self._start('launch_app._save_cached_path')
+        self.mock_bundle_exe = self._start('launch_app._mac_bundle_executable', return_value=None)
+        self.mock_execv = self._start('os.execv')
+        self.mock_spawn = self._start('os.posix_spawn', create=True)
+        self.mock_popen = self._start('subprocess.Popen')
+        self.mock_stdout = self._start('sys.stdout', new_callable=io.StringIO)
+        self.mock_stderr = self._start('sys.stderr', new_callable=io.StringIO)
+        self._use_paths('/path/to/App', '/path/to/Companion', self._JOIN_MAP_MAC, self._JOIN_MAP_LINUX)
+
+    def _start(self, target, *args, **kwargs):
+        patcher = patch(target, *args, **kwargs)
+        mock = patcher.start()
+        self.addCleanup(patcher.stop)
+        return mock
+
+    def _use_paths(self, app_base_dir, script_dir, *join_maps):
+        self._start('launch_app._APP_BASE_DIR', app_base_dir)
+        self._start('launch_app._SCRIPT_DIR', script_dir)
+        join_map = {k: v for m in join_maps for k, v in m.items()}
+        self.mock_join.side_effect = lambda *a: join_map.get(a) or os.path.normpath(_real_join(*a))
+
+    def _use_windows_paths(self):
+        self._use_paths('C:\\path\\to\\App', 'C:\\path\\to\\Companion', self._JOIN_MAP_WIN)
+
+    def test_launch_mac(self):
+        """Test launching the app on macOS via `open` when the bundle binary is unusable."""
+        self.mock_get_os.return_value = 'mac'
+        self.mock_scandir.side_effect = make_scandir(['SomeOtherFile', 'TestApp.app']) # Simulate finding the app
 
         launch_app.launch_application()
 
         # Assertions
-        mock_get_os.assert_called_once()
-        mock_listdir.assert_called_with('/path/to/App/src-tauri/target/release/bundle/macos')
-        mock_run.assert_called_once_with(['open', '/path/to/App/src-tauri/target/release/bundle/macos/TestApp.app'], check=True)
-
-    @patch('launch_app.get_os')
-    @patch('subprocess.run')
-    @patch('os.path.abspath')
-    @patch('os.path.join')
-    @patch('os.listdir')
-    @patch('os.path.dirname')
-    def test_launch_windows(self, mock_dirname, mock_listdir, mock_join, mock_abspath, mock_run, mock_get_os):
+        self.mock_get_os.assert_called_once()
+        self.mock_scandir.assert_called_with('/path/to/App/src-tauri/target/release/bundle/macos')
+        self.mock_popen.assert_called_once_with(['open', '/path/to/App/src-tauri/target/release/bundle/macos/TestApp.app'])
+        self.assertIn("Successfully launched application for mac.", self.mock_stdout.getvalue())
+
+    def test_launch_windows(self):
         """Test launching the app on Windows."""
-        mock_get_os.return_value = 'windows'
-        mock_dirname.return_value = 'C:\\path\\to\\Companion'
-        mock_abspath.return_value = 'C:\\path\\to\\App'
-
-        def join_side_effect(*args):
-             if args == ('C:\\path\\to\\Companion', '..', 'App'):
-                 return 'C:\\path\\to\\App'
-             elif args == ('C:\\path\\to\\App', 'src-tauri', 'target', 'release'):
-                 return 'C:\\path\\to\\App\\src-tauri\\target\\release'
-             elif args == ('C:\\path\\to\\App\\src-tauri\\target\\release', 'TestApp.exe'):
-                  return 'C:\\path\\to\\App\\src-tauri\\target\\release\\TestApp.exe'
-             return os.path.normpath(os.path.join(*args))
-        mock_join.side_effect = join_side_effect
-
-        mock_listdir.return_value = ['config.toml', 'TestApp.exe']
+        self.mock_get_os.return_value = 'windows'
+        self._use_windows_paths()
+        self.mock_scandir.side_effect = make_scandir(['config.toml', 'TestApp.exe'], sep='\\')
 
         launch_app.launch_application()
 
-        mock_get_os.assert_called_once()
-        mock_listdir.assert_called_with('C:\\path\\to\\App\\src-tauri\\target\\release')
-        mock_run.assert_called_once_with(['C:\\path\\to\\App\\src-tauri\\target\\release\\TestApp.exe'], check=True)
-
-    @patch('launch_app.get_os')
-    @patch('subprocess.run')
-    @patch('os.path.abspath')
-    @patch('os.path.join')
-    @patch('os.listdir')
-    @patch('os.chmod')
-    @patch('os.path.dirname')
-    def test_launch_linux(self, mock_dirname, mock_chmod, mock_listdir, mock_join, mock_abspath, mock_run, mock_get_os):
+        self.mock_get_os.assert_called_once()
+        self.mock_scandir.assert_called_with('C:\\path\\to\\App\\src-tauri\\target\\release')
+        self.mock_execv.assert_called_once_with('C:\\path\\to\\App\\src-tauri\\target\\release\\TestApp.exe', ['C:\\path\\to\\App\\src-tauri\\target\\release\\TestApp.exe'])
+
+    def test_launch_linux(self):
         """Test launching the app on Linux."""
-        mock_get_os.return_value = 'linux'
-        mock_dirname.return_value = '/path/to/Companion'
-        mock_abspath.return_value = '/path/to/App'
-
-        def join_side_effect(*args):
-            if args == ('/path/to/Companion', '..', 'App'):
-                return '/path/to/App'
-            elif args == ('/path/to/App', 'src-tauri', 'target', 'release', 'bundle', 'appimage'):
-                return '/path/to/App/src-tauri/target/release/bundle/appimage'
-            elif args == ('/path/to/App/src-tauri/target/release/bundle/appimage', 'TestApp.AppImage'):
-                 return '/path/to/App/src-tauri/target/release/bundle/appimage/TestApp.AppImage'
-            return os.path.normpath(os.path.join(*args))
-        mock_join.side_effect = join_side_effect
-
-        mock_listdir.return_value = ['icon.png', 'TestApp.AppImage']
+        self.mock_get_os.return_value = 'linux'
+        self.mock_scandir.side_effect = make_scandir(['icon.png', 'TestApp.AppImage'])
+
+        launch_app.launch_application()
+
+        self.mock_get_os.assert_called_once()
+        self.mock_scandir.assert_called_with('/path/to/App/src-tauri/target/release/bundle/appimage')
+        self.mock_stat.assert_called_once_with('/path/to/App/src-tauri/target/release/bundle/appimage/TestApp.AppImage')
+        self.mock_chmod.assert_not_called() # Already executable
+        self.mock_execv.assert_called_once_with('/path/to/App/src-tauri/target/release/bundle/appimage/TestApp.AppImage', ['/path/to/App/src-tauri/target/release/bundle/appimage/TestApp.AppImage'])
+        # The exec replaces the process, so no success message is printed
+        self.assertNotIn("Successfully launched", self.mock_stdout.getvalue())
+
+    def test_launch_linux_not_executable(self):
+        """Test that a non-executable AppImage is made executable before launch."""
+        self.mock_get_os.return_value = 'linux'
+        self.mock_stat.return_value = SimpleNamespace(st_mode=0o100644)
+        self.mock_scandir.side_effect = make_scandir(['icon.png', 'TestApp.AppImage'])
 
         launch_app.launch_application()
 
-        mock_get_os.assert_called_once()
-        mock_listdir.assert_called_with('/path/to/App/src-tauri/target/release/bundle/appimage')
-        mock_chmod.assert_called_once_with('/path/to/App/src-tauri/target/release/bundle/appimage/TestApp.AppImage', 0o755)
-        mock_run.assert_called_once_with(['/path/to/App/src-tauri/target/release/bundle/appimage/TestApp.AppImage'], check=True)
-
-    @patch('launch_app.get_os')
-    @patch('subprocess.run')
-    @patch('os.path.abspath')
-    @patch('os.path.join')
-    @patch('os.listdir')
-    @patch('os.path.dirname')
-    @patch('sys.stderr', new_callable=io.StringIO) # Capture stderr
-    def test_launch_mac_not_found(self, mock_stderr, mock_dirname, mock_listdir, mock_join, mock_abspath, mock_run, mock_get_os):
+        self.mock_stat.assert_called_once_with('/path/to/App/src-tauri/target/release/bundle/appimage/TestApp.AppImage')
+        self.mock_chmod.assert_called_once_with('/path/to/App/src-tauri/target/release/bundle/appimage/TestApp.AppImage', 0o755)
+        self.mock_execv.assert_called_once_with('/path/to/App/src-tauri/target/release/bundle/appimage/TestApp.AppImage', ['/path/to/App/src-tauri/target/release/bundle/appimage/TestApp.AppImage'])
+
+    def test_launch_mac_not_found(self):
         """Test launch failure when Mac .app is not found."""
-        mock_get_os.return_value = 'mac'
-        mock_dirname.return_value = '/path/to/Companion'
-        mock_abspath.return_value = '/path/to/App'
-        # Use a simple lambda to avoid recursion with the original os.path.join
-        mock_join.side_effect = lambda *args: os.path.normpath("/".join(args))
-        mock_listdir.return_value = ['SomeOtherFile'] # App not present
+        self.mock_get_os.return_value = 'mac'
+        self.mock_scandir.side_effect = make_scandir(['SomeOtherFile']) # App not present
+
+        with self.assertRaises(SystemExit) as cm:
+            launch_app.launch_application()
+
+        self.assertEqual(cm.exception.code, 1)
+        self.assertIn("Application executable not found", self.mock_stderr.getvalue())
+        self.assertIn("Mac .app bundle not found", self.mock_stderr.getvalue())
+        self.mock_popen.assert_not_called()
+
+    def test_launch_exec_error(self):
+        """Test launch failure when the executable cannot be exec'd."""
+        self.mock_get_os.return_value = 'windows'
+        self._use_windows_paths()
+        self.mock_scandir.side_effect = make_scandir(['TestApp.exe'], sep='\\')
+        self.mock_execv.side_effect = PermissionError(13, 'Permission denied') # Simulate launch failure
 
         with self.assertRaises(SystemExit) as cm:
             launch_app.launch_application()
 
         self.assertEqual(cm.exception.code, 1)
-        self.assertIn("Application executable not found", mock_stderr.getvalue())
-        self.assertIn("Mac .app bundle not found", mock_stderr.getvalue())
-        mock_run.assert_not_called()
-
-    @patch('launch_app.get_os')
-    @patch('subprocess.run')
-    @patch('os.path.abspath')
-    @patch('os.path.join')
-    @patch('os.listdir')
-    @patch('os.path.dirname')
-    @patch('sys.stderr', new_callable=io.StringIO)
-    def test_launch_subprocess_error(self, mock_stderr, mock_dirname, mock_listdir, mock_join, mock_abspath, mock_run, mock_get_os):
-        """Test launch failure due to subprocess error."""
-        mock_get_os.return_value = 'windows'
-        mock_dirname.return_value = 'C:\\path\\to\\Companion'
-        mock_abspath.return_value = 'C:\\path\\to\\App'
-        # Use a simple lambda to avoid recursion with the original os.path.join
-        mock_join.side_effect = lambda *args: os.path.normpath("\\".join(args)) # Basic Windows path join
-        mock_listdir.return_value = ['TestApp.exe']
-        mock_run.side_effect = subprocess.CalledProcessError(1, 'cmd') # Simulate launch failure
+        self.assertIn("Error launching application", self.mock_stderr.getvalue())
+        self.mock_execv.assert_called_once() # Ensure it was attempted
+
+    def test_launch_mac_binary(self):
+        """Test that the bundle's binary is spawned directly when it can be resolved."""
+        self.mock_get_os.return_value = 'mac'
+        self.mock_scandir.side_effect = make_scandir(['TestApp.app'])
+        binary = '/path/to/App/src-tauri/target/release/bundle/macos/TestApp.app/Contents/MacOS/TestApp'
+        self.mock_bundle_exe.return_value = binary
+
+        launch_app.launch_application()
+
+        self.mock_bundle_exe.assert_called_once_with('/path/to/App/src-tauri/target/release/bundle/macos/TestApp.app')
+        self.mock_spawn.assert_called_once_with(binary, [binary], os.environ)
+        self.mock_popen.assert_not_called()
+        self.mock_save_cache.assert_called_once_with('mac', '/path/to/App', binary)
+
+    def test_launch_bundle_dir_missing(self):
+        """Test launch failure when the App has not been built yet."""
+        self.mock_get_os.return_value = 'linux'
+        self.mock_isdir.return_value = False
 
         with self.assertRaises(SystemExit) as cm:
             launch_app.launch_application()
 
         self.assertEqual(cm.exception.code, 1)
-        self.assertIn("Error launching application", mock_stderr.getvalue())
-        mock_run.assert_called_once() # Ensure it was attempted
+        self.assertIn("Linux AppImage not built at /path/to/App/src-tauri/target/release/bundle/appimage", self.mock_stderr.getvalue())
+        self.mock_scandir.assert_not_called()
+        self.mock_execv.assert_not_called()
+
+    def test_launch_uses_manifest_path(self):
+        """Test that a manifest entry skips both the cache and the directory scan."""
+        self.mock_get_os.return_value = 'windows'
+        self._use_windows_paths()
+        self.mock_manifest.return_value = 'C:\\built\\TestApp.exe'
+
+        launch_app.launch_application()
+
+        self.mock_manifest.assert_called_once_with('windows')
+        self.mock_load_cache.assert_not_called()
+        self.mock_scandir.assert_not_called()
+        self.mock_save_cache.assert_not_called()
+        self.mock_execv.assert_called_once_with('C:\\built\\TestApp.exe', ['C:\\built\\TestApp.exe'])
+
+    def test_launch_uses_cached_path(self):
+        """Test that a valid cached app path skips the directory scan."""
+        self.mock_get_os.return_value = 'linux'
+        self.mock_load_cache.return_value = '/cached/TestApp.AppImage'
+
+        launch_app.launch_application()
+
+        self.mock_load_cache.assert_called_once_with('linux', '/path/to/App')
+        self.mock_scandir.assert_not_called()
+        self.mock_save_cache.assert_not_called()
+        self.mock_execv.assert_called_once_with('/cached/TestApp.AppImage', ['/cached/TestApp.AppImage'])
+
+    def test_launch_saves_scanned_path(self):
+        """Test that a freshly scanned app path is written to the cache."""
+        self.mock_get_os.return_value = 'linux'
+        self.mock_scandir.side_effect = make_scandir(['TestApp.AppImage'])
+
+        launch_app.launch_application()
+
+        self.mock_save_cache.assert_called_once_with(
+            'linux', '/path/to/App', '/path/to/App/src-tauri/target/release/bundle/appimage/TestApp.AppImage')
+
+
+class TestFindFirst(unittest.TestCase):
+
+    @patch('os.scandir')
+    def test_matches_only_requested_suffix(self, mock_scandir):
+        """Test that other artifact types and partial suffixes are skipped."""
+        mock_scandir.side_effect = make_scandir(['TestApp.exe', 'TestApp.app.bak', '.app', 'TestApp.app'])
+        self.assertEqual(launch_app._find_first('/bundle', '.app'), '/bundle/TestApp.app')
+
+    @patch('os.scandir')
+    def test_no_match(self, mock_scandir):
+        """Test that None is returned when nothing matches."""
+        mock_scandir.side_effect = make_scandir(['icon.png', 'TestApp.exe'])
+        self.assertIsNone(launch_app._find_first('/bundle', '.AppImage'))
+
+
+class TestManifest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.manifest = os.path.join(self.tmp.name, '.app_manifest')
+        manifest_patcher = patch('launch_app._MANIFEST_FILE', self.manifest)
+        manifest_patcher.start()
+        self.addCleanup(manifest_patcher.stop)
+        self.app_path = os.path.join(self.tmp.name, 'TestApp.AppImage')
+        open(self.app_path, 'w').close()
+
+    def _write(self, text):
+        with open(self.manifest, 'w') as f:
+            f.write(text)
+
+    def test_reads_entry_for_os(self):
+        """Test that the line for the detected OS is used."""
+        self._write(f"mac=/missing/TestApp.app\nlinux={self.app_path}\n")
+        self.assertEqual(launch_app._read_manifest_path('linux'), self.app_path)
+
+    def test_missing_manifest(self):
+        """Test that an absent manifest is ignored."""
+        self.assertIsNone(launch_app._read_manifest_path('linux'))
+
+    def test_stale_entry(self):
+        """Test that an entry pointing at a missing file is ignored."""
+        self._write("linux=/missing/TestApp.AppImage\n")
+        self.assertIsNone(launch_app._read_manifest_path('linux'))
+
+    def test_no_entry_for_os(self):
+        """Test that a manifest without a line for this OS is ignored."""
+        self._write(f"windows={self.app_path}\n")
+        self.assertIsNone(launch_app._read_manifest_path('linux'))
+
+    def test_mac_bundle_resolved_once(self):
+        """Test that a manifest .app is resolved and cached once, then served from the cache."""
+        cache_patcher = patch('launch_app._CACHE_FILE', os.path.join(self.tmp.name, 'cache', 'app_path.json'))
+        cache_patcher.start()
+        self.addCleanup(cache_patcher.stop)
+        bundle = os.path.join(self.tmp.name, 'TestApp.app')
+        os.makedirs(os.path.join(bundle, 'Contents', 'MacOS'))
+        with open(os.path.join(bundle, 'Contents', 'Info.plist'), 'wb') as f:
+            plistlib.dump({'CFBundleExecutable': 'test-app'}, f)
+        binary = os.path.join(bundle, 'Contents', 'MacOS', 'test-app')
+        open(binary, 'w').close()
+        os.chmod(binary, 0o755)
+        self._write(f"mac={bundle}\n")
+
+        with patch('launch_app._save_cached_path', wraps=launch_app._save_cached_path) as mock_save, \
+             patch('launch_app._mac_bundle_executable', wraps=launch_app._mac_bundle_executable) as mock_bundle_exe:
+            for _ in range(3):
+                self.assertEqual(launch_app._resolve_app_path('mac', '/path/to/App'), binary)
+
+        mock_save.assert_called_once_with('mac', '/path/to/App', binary)
+        mock_bundle_exe.assert_called_once_with(bundle)
+
+
+class TestAppPathCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        cache_patcher = patch('launch_app._CACHE_FILE', os.path.join(self.tmp.name, 'cache', 'app_path.json'))
+        cache_patcher.start()
+        self.addCleanup(cache_patcher.stop)
+        self.bundle_dir = os.path.join(self.tmp.name, 'bundle')
+        os.mkdir(self.bundle_dir)
+        self.app_path = os.path.join(self.bundle_dir, 'TestApp.AppImage')
+        open(self.app_path, 'w').close()
+
+    def test_round_trip(self):
+        """Test that a saved path is returned for the same OS and App directory."""
+        launch_app._save_cached_path('linux', '/path/to/App', self.app_path)
+        self.assertEqual(launch_app._load_cached_path('linux', '/path/to/App'), self.app_path)
+
+    def test_miss_without_cache_file(self):
+        """Test that a missing cache file is treated as a miss."""
+        self.assertIsNone(launch_app._load_cached_path('linux', '/path/to/App'))
+
+    def test_miss_for_other_key(self):
+        """Test that entries for another OS or App directory are ignored."""
+        launch_app._save_cached_path('linux', '/path/to/App', self.app_path)
+        self.assertIsNone(launch_app._load_cached_path('mac', '/path/to/App'))
+        self.assertIsNone(launch_app._load_cached_path('linux', '/other/App'))
+
+    def test_miss_after_rebuild(self):
+        """Test that a changed bundle directory invalidates the entry."""
+        launch_app._save_cached_path('linux', '/path/to/App', self.app_path)
+        st = os.stat(self.bundle_dir)
+        os.utime(self.bundle_dir, (st.st_atime, st.st_mtime + 10))
+        self.assertIsNone(launch_app._load_cached_path('linux', '/path/to/App'))
+
+    def test_miss_when_app_removed(self):
+        """Test that a deleted executable invalidates the entry."""
+        launch_app._save_cached_path('linux', '/path/to/App', self.app_path)
+        os.remove(self.app_path)
+        self.assertIsNone(launch_app._load_cached_path('linux', '/path/to/App'))
+
+
+class TestMacBundleExecutable(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.bundle = os.path.join(self.tmp.name, 'TestApp.app')
+        os.makedirs(os.path.join(self.bundle, 'Contents', 'MacOS'))
+        with open(os.path.join(self.bundle, 'Contents', 'Info.plist'), 'wb') as f:
+            plistlib.dump({'CFBundleExecutable': 'test-app'}, f)
+        self.binary = os.path.join(self.bundle, 'Contents', 'MacOS', 'test-app')
+        open(self.binary, 'w').close()
+
+    def test_resolves_executable(self):
+        """Test that the binary named by CFBundleExecutable is returned."""
+        os.chmod(self.binary, 0o755)
+        self.assertEqual(launch_app._mac_bundle_executable(self.bundle), self.binary)
+
+    def test_not_executable(self):
+        """Test that a binary without the executable bit is rejected."""
+        os.chmod(self.binary, 0o644)
+        self.assertIsNone(launch_app._mac_bundle_executable(self.bundle))
+
+    def test_missing_plist(self):
+        """Test that a bundle without Info.plist is rejected."""
+        os.remove(os.path.join(self.bundle, 'Contents', 'Info.plist'))
+        self.assertIsNone(launch_app._mac_bundle_executable(self.bundle))
 
 
 if __name__ == '__main__':